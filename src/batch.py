@@ -0,0 +1,210 @@
+"""
+Simulate many independent games at once with NumPy.
+
+Every game in a batch is a row of a struct-of-arrays: ``alive``,
+``mafia`` and ``agent`` are boolean ``(games, players)`` arrays, action
+targets are integer arrays using ``NO_TARGET`` for nobody, and votes are
+``+1`` for guilty, ``-1`` for innocent and ``0`` for abstain. The rule
+functions are batched versions of those in :mod:`engine` and return one
+result per game.
+"""
+import math
+
+import numpy as np
+
+
+NO_TARGET = -1
+
+GUILTY = 1
+INNOCENT = -1
+ABSTAIN = 0
+TIE = 0
+
+NOBODY = 0
+TOWN = 1
+MAFIA = 2
+
+WINNER_NAMES = {NOBODY: "Nobody", TOWN: "Town", MAFIA: "Mafia"}
+
+
+def create_mafia(rng, games, player_count):
+    """
+    Pick ``floor(sqrt(player_count))`` distinct mafia members per game.
+
+    :return: A boolean array of shape (games, player_count).
+    """
+    number_of_mafia = math.floor(math.sqrt(player_count))
+    order = rng.random((games, player_count)).argsort(axis=1)
+    return order < number_of_mafia
+
+
+def count_accusations(accusing):
+    """
+    Batched version of :func:`engine.most_accused`.
+
+    :param accusing: Integer array of shape (games, players) holding the
+        number of the accused player or NO_TARGET.
+    :return: The defendant of every game, or NO_TARGET on a tie.
+    """
+    games, player_count = accusing.shape
+    valid = accusing != NO_TARGET
+
+    offsets = np.arange(games)[:, None] * player_count
+    counts = np.bincount((accusing + offsets)[valid], minlength=games * player_count)
+    counts = counts.reshape(games, player_count)
+
+    highest = counts.max(axis=1)
+    leaders = (counts == highest[:, None]).sum(axis=1)
+    return np.where(leaders == 1, counts.argmax(axis=1), NO_TARGET)
+
+
+def decide_verdict(votes):
+    """
+    Batched version of :func:`engine.decide_verdict`.
+
+    :return: GUILTY, INNOCENT or TIE for every game.
+    """
+    return np.sign(votes.sum(axis=1, dtype=np.int64)).astype(np.int8)
+
+
+def check_for_winner(alive, mafia):
+    """
+    Batched version of :func:`engine.check_for_winner`.
+
+    :return: NOBODY, TOWN or MAFIA for every game.
+    """
+    mafia_count = (alive & mafia).sum(axis=1)
+    towny_count = (alive & ~mafia).sum(axis=1)
+
+    winner = np.full(alive.shape[0], NOBODY, dtype=np.int8)
+    winner[mafia_count == 0] = TOWN
+    winner[towny_count == 0] = MAFIA
+    return winner
+
+
+def random_choice(rng, candidates):
+    """
+    Pick one candidate per row uniformly at random.
+
+    :param candidates: Boolean array whose last axis marks the options.
+    :return: The index of the chosen option, or NO_TARGET if there were none.
+    """
+    keys = rng.random(candidates.shape)
+    keys[~candidates] = -1.
+    choice = keys.argmax(axis=-1)
+    return np.where(candidates.any(axis=-1), choice, NO_TARGET)
+
+
+class BatchGame:
+    """
+    A batch of games advanced in lock-step.
+
+    Each round calls :meth:`discussion`, :meth:`trial` and :meth:`night`;
+    games that already have a winner are left untouched, and games without
+    a defendant skip the trial.
+    """
+
+    def __init__(self, games, player_count, agent_number=-1, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.games = games
+        self.player_count = player_count
+
+        shape = (games, player_count)
+        self.alive = np.ones(shape, dtype=bool)
+        self.mafia = create_mafia(self.rng, games, player_count)
+        self.agent = np.zeros(shape, dtype=bool)
+        if 0 <= agent_number < player_count:
+            self.agent[:, agent_number] = True
+
+        self.accusing = np.full(shape, NO_TARGET, dtype=np.intp)
+        self.suspecting = np.full(shape, NO_TARGET, dtype=np.intp)
+        self.votes = np.zeros(shape, dtype=np.int8)
+        self.defendant = np.full(games, NO_TARGET, dtype=np.intp)
+        self.winner = np.full(games, NOBODY, dtype=np.int8)
+        self.rounds = 0
+
+    @property
+    def active(self):
+        return self.winner == NOBODY
+
+    def reset_actions(self) -> None:
+        self.accusing.fill(NO_TARGET)
+        self.suspecting.fill(NO_TARGET)
+        self.votes.fill(ABSTAIN)
+
+    def discussion(self):
+        """
+        :return: The defendant of every game, NO_TARGET where nobody goes on trial.
+        """
+        self.defendant = count_accusations(self.accusing)
+        self.defendant[~self.active] = NO_TARGET
+        return self.defendant
+
+    def trial(self):
+        """
+        Execute every defendant found guilty.
+
+        :return: The verdict of every game, TIE where there was no trial.
+        """
+        on_trial = self.defendant != NO_TARGET
+        verdict = np.where(on_trial, decide_verdict(self.votes), TIE)
+
+        guilty = np.flatnonzero(verdict == GUILTY)
+        self.alive[guilty, self.defendant[guilty]] = False
+
+        self.defendant.fill(NO_TARGET)
+        self._settle()
+        return verdict
+
+    def night(self, victims) -> None:
+        """
+        :param victims: The player killed by the mafia in every game, or NO_TARGET.
+        """
+        killed = np.flatnonzero((victims != NO_TARGET) & self.active)
+        self.alive[killed, victims[killed]] = False
+
+        self.reset_actions()
+        self.rounds += 1
+        self._settle()
+
+    def _settle(self) -> None:
+        active = self.active
+        self.winner[active] = check_for_winner(self.alive[active], self.mafia[active])
+
+    def random_actions(self) -> None:
+        """
+        Every living player accuses another living player and votes at random.
+        """
+        others = self.alive[:, None, :] & ~np.eye(self.player_count, dtype=bool)
+        self.accusing = np.where(self.alive, random_choice(self.rng, others), NO_TARGET)
+        self.votes = np.where(
+            self.alive, self.rng.choice((GUILTY, INNOCENT), size=self.alive.shape), ABSTAIN
+        ).astype(np.int8)
+
+    def random_victims(self):
+        """
+        :return: A random living town member for every game.
+        """
+        return random_choice(self.rng, self.alive & ~self.mafia)
+
+    def play_random(self, max_rounds=None):
+        """
+        Play every game to the end with random actions.
+
+        :return: The winner of every game.
+        """
+        while self.active.any() and (max_rounds is None or self.rounds < max_rounds):
+            self.random_actions()
+            self.discussion()
+            self.trial()
+            self.night(self.random_victims())
+
+        return self.winner
+
+
+def win_rates(winners) -> dict:
+    """
+    :return: The fraction of games won by each side, keyed by name.
+    """
+    counts = np.bincount(winners, minlength=len(WINNER_NAMES))
+    return {WINNER_NAMES[code]: float(counts[code]) / len(winners) for code in WINNER_NAMES}
@@ -0,0 +1,365 @@
+"""
+Headless implementation of the game rules.
+
+Nothing in this module imports Kivy, so whole games can be simulated
+without a window or kv files. The stages in :mod:`stages` wrap these
+functions for the interactive game, and :class:`Game` drives the same
+rules directly on compact :class:`PlayerState` records.
+"""
+import math
+import random
+
+
+NOBODY = "Nobody"
+TOWN = "Town"
+MAFIA = "Mafia"
+
+DISCUSSION = "discussion"
+TRIAL = "trial"
+NIGHT = "night"
+GAME_OVER = "gameovermenu"
+
+GUILTY = "guilty"
+INNOCENT = "innocent"
+ABSTAIN = "abstain"
+TIE = "tie"
+
+ALIVE_ICON = "data/icons/player_alive.png"
+DEAD_ICON = "data/icons/player_dead.png"
+AGENT_ICON = "./data/icons/agent_alive.png"
+EASTER_EGG_ICON = "data/icons/easter_egg.png"
+
+
+class PlayerState:
+    """
+    The data of a single player without any of the widget machinery.
+
+    Action targets are stored as player numbers rather than references,
+    which keeps the record small and trivially copyable.
+    """
+    __slots__ = (
+        'name', 'number', 'icon', 'alive', 'mafia', 'agent',
+        'is_on_trial', 'strategic_value', 'current_action',
+        'accusing', 'suspecting', 'vote',
+    )
+
+    def __init__(self, name="player", number=0, icon="", alive=True,
+                 mafia=False, agent=False, is_on_trial=False,
+                 strategic_value=0, current_action=ABSTAIN, actions=None):
+        self.name = name
+        self.number = int(number)
+        self.icon = icon
+        self.alive = alive
+        self.mafia = mafia
+        self.agent = agent
+        self.is_on_trial = is_on_trial
+        self.strategic_value = strategic_value
+        self.current_action = current_action
+        self.reset_actions()
+
+        if actions:
+            self.accusing = actions['accuse']['player']
+            self.suspecting = actions['suspect']['player']
+            self.vote = actions['vote']['decision']
+
+    @property
+    def actions(self) -> dict:
+        """
+        The actions of this player in the same nested layout as
+        :attr:`player.Player.actions`, with targets given by number.
+        """
+        return {
+            'accuse': {'player': self.accusing},
+            'suspect': {'player': self.suspecting},
+            'vote': {'decision': self.vote},
+        }
+
+    def __iter__(self):
+        return iter([('name', self.name),
+                     ('agent', self.agent),
+                     ('number', self.number),
+                     ('is_on_trial', self.is_on_trial),
+                     ('icon', self.icon),
+                     ('mafia', self.mafia),
+                     ('alive', self.alive),
+                     ('strategic_value', self.strategic_value),
+                     ('current_action', self.current_action),
+                     ('actions', self.actions)])
+
+    def __repr__(self):
+        return "PlayerState(name={!r}, number={})".format(self.name, self.number)
+
+    def reset_actions(self) -> None:
+        self.accusing = None
+        self.suspecting = None
+        self.vote = ABSTAIN
+
+    def act_on(self, action, target) -> bool:
+        """
+        Accuse or suspect another player by number, following the same
+        rules as :meth:`player.Player.act_on`.
+
+        :return: True if the action was recorded.
+        """
+        if target == self.number:
+            return False
+
+        if action == 'suspect' and self.accusing != target:
+            self.suspecting = target
+        elif action == 'accuse' and self.suspecting != target:
+            self.accusing = target
+        else:
+            return False
+
+        return True
+
+    def abstain(self) -> None:
+        self.accusing = None
+        self.suspecting = None
+
+    def die(self) -> None:
+        self.alive = False
+        self.icon = DEAD_ICON
+
+
+def number_of_mafia(player_count) -> int:
+    return math.floor(math.sqrt(player_count))
+
+
+def create_players(player_count, agent_number, rng=random):
+    """
+    Create the players of a new game and pick the mafia at random.
+
+    :param rng: Source of randomness, either the :mod:`random` module or
+        a :class:`random.Random` instance.
+    :return: A list of PlayerState objects indexed by player number.
+    """
+    players = []
+
+    for number in range(player_count):
+        icon = EASTER_EGG_ICON if rng.random() < 0.01 else ALIVE_ICON
+        players.append(PlayerState(name='player {}'.format(number), number=number, icon=icon))
+
+    if 0 <= agent_number < player_count:
+        new_agent = players[agent_number]
+        new_agent.name = "agent"
+        new_agent.icon = AGENT_ICON
+        new_agent.agent = True
+
+    for player in rng.sample(players, number_of_mafia(player_count)):
+        player.mafia = True
+
+    return players
+
+
+def tally(targets, player_count):
+    """
+    Count how many times each player number appears in targets.
+
+    :param targets: An iterable of player numbers or None.
+    :return: A list of counts indexed by player number.
+    """
+    counts = [0] * player_count
+    for target in targets:
+        if target is not None:
+            counts[target] += 1
+    return counts
+
+
+def most_accused(counts):
+    """
+    Find the player with the single highest count.
+
+    :return: The number of that player, or None if nobody was accused
+        or the highest count is shared.
+    """
+    if not counts:
+        return None
+
+    highest = max(counts)
+    leader = counts.index(highest)
+
+    if counts.count(highest) > 1:
+        return None
+
+    return leader
+
+
+def count_votes(decisions):
+    """
+    :param decisions: An iterable of vote decisions.
+    :return: A dict with the number of guilty and innocent votes.
+    """
+    vote = {GUILTY: 0, INNOCENT: 0}
+    for decision in decisions:
+        if decision in vote:
+            vote[decision] += 1
+    return vote
+
+
+def decide_verdict(decisions) -> str:
+    """
+    :param decisions: An iterable of vote decisions.
+    :return: A string with the value of guilty, innocent, or tie.
+    """
+    vote = count_votes(decisions)
+
+    if vote[GUILTY] == vote[INNOCENT]:
+        return TIE
+
+    return GUILTY if vote[GUILTY] > vote[INNOCENT] else INNOCENT
+
+
+class Census:
+    """
+    Live counts of the players still in the game and the current defendant,
+    kept up to date as players die so that nobody has to rescan the table.
+    """
+    __slots__ = ('alive_mafia', 'alive_town', 'defendant')
+
+    def __init__(self, players=()):
+        self.alive_mafia = 0
+        self.alive_town = 0
+        self.defendant = None
+
+        for player in players:
+            if player.alive:
+                if player.mafia:
+                    self.alive_mafia += 1
+                else:
+                    self.alive_town += 1
+            if player.is_on_trial:
+                self.defendant = player.number
+
+    def kill(self, player) -> None:
+        """
+        Count a living player as dead. The caller is responsible for only
+        passing players that were alive.
+        """
+        if player.mafia:
+            self.alive_mafia -= 1
+        else:
+            self.alive_town -= 1
+
+        if player.number == self.defendant:
+            self.defendant = None
+
+    @property
+    def winner(self) -> str:
+        winner = NOBODY
+
+        if self.alive_mafia == 0:
+            winner = TOWN
+
+        if self.alive_town == 0:
+            winner = MAFIA
+
+        return winner
+
+
+def check_for_winner(players) -> str:
+    """
+    Works on anything with ``alive``, ``mafia`` and ``is_on_trial``
+    attributes, so both PlayerState records and Player widgets can be
+    passed in. Prefer a live :class:`Census` over calling this repeatedly.
+
+    :return: "Town", "Mafia" or "Nobody".
+    """
+    return Census(players).winner
+
+
+class Game:
+    """
+    A single game played without any user interface.
+
+    The phases follow the stages of the app: :meth:`discussion` moves on
+    to the trial or the night, :meth:`trial` moves on to the night and
+    :meth:`night` starts the next round's discussion. Whenever a side
+    has won, :attr:`phase` becomes ``GAME_OVER`` and :attr:`winner` is set.
+    Actions are recorded on the players between phases.
+    """
+
+    def __init__(self, player_count, agent_number=-1, seed=None):
+        self.rng = random.Random(seed)
+        self.players = create_players(player_count, agent_number, self.rng)
+        self.census = Census(self.players)
+        self.phase = DISCUSSION
+        self.winner = NOBODY
+        self.round = 0
+
+    def __len__(self):
+        return len(self.players)
+
+    @property
+    def defendant(self):
+        return self.census.defendant
+
+    def alive_players(self):
+        return [player for player in self.players if player.alive]
+
+    def _expect(self, phase) -> None:
+        if self.phase != phase:
+            raise ValueError("Game is in the {} phase, not {}.".format(self.phase, phase))
+
+    def kill(self, number) -> None:
+        player = self.players[number]
+        if player.alive:
+            self.census.kill(player)
+            player.die()
+
+    def _settle(self, next_phase) -> None:
+        self.winner = self.census.winner
+        self.phase = next_phase if self.winner == NOBODY else GAME_OVER
+
+    def discussion(self):
+        """
+        Put the most accused player on trial.
+
+        :return: The number of the defendant, or None if nobody goes on trial.
+        """
+        self._expect(DISCUSSION)
+        counts = tally((player.accusing for player in self.players), len(self.players))
+        self.census.defendant = most_accused(counts)
+
+        if self.defendant is None:
+            self.phase = NIGHT
+        else:
+            self.players[self.defendant].is_on_trial = True
+            self.phase = TRIAL
+
+        return self.defendant
+
+    def trial(self) -> str:
+        """
+        Count the votes and execute the defendant if found guilty.
+
+        :return: The verdict.
+        """
+        self._expect(TRIAL)
+        defendant = self.players[self.defendant]
+        verdict = decide_verdict(player.vote for player in self.players)
+        defendant.is_on_trial = False
+
+        if verdict == GUILTY:
+            self.kill(defendant.number)
+
+        self.census.defendant = None
+        self._settle(NIGHT)
+        return verdict
+
+    def night(self, victim=None) -> None:
+        """
+        Kill the victim chosen by the mafia, if any, and start a new round.
+
+        :param victim: The number of the player to kill, or None.
+        """
+        self._expect(NIGHT)
+
+        if victim is not None:
+            self.kill(victim)
+
+        for player in self.players:
+            player.reset_actions()
+
+        self.round += 1
+        self._settle(DISCUSSION)
@@ -70,8 +70,9 @@ class Player(BoxLayout, BorderBehavior):
 
     def die(self):
         stage = App.get_running_app().root.current_screen
-        stage.players[self.number].alive = self.alive = False
-        stage.players[self.number].icon = self.icon = "data/icons/player_dead.png"
+        stage.kill_player(stage.players[self.number])
+        self.alive = False
+        self.icon = "data/icons/player_dead.png"
 
     def set_strategic_value(self, strategic_value):
         tolerance = 1.5
@@ -1,6 +1,4 @@
-from collections import Counter
 import json
-import math
 import random
 from kivy.clock import Clock
 from kivy.lang import Builder
@@ -12,6 +10,7 @@ from kivy.config import Config
 
 
 try:
+    import engine
     from border_behavior import BorderBehavior
     from player import (
         Player, PlayerIcon, DiscussionPlayer,
@@ -19,6 +18,7 @@ try:
         TrialPlayer, TrialAgent
     )
 except ModuleNotFoundError:
+    from . import engine
     from .border_behavior import BorderBehavior
     from .player import (
         Player, PlayerIcon, DiscussionPlayer,
@@ -39,6 +39,8 @@ class Stage(Screen):
 
     # Static variables
     players = list()
+    # Live counts of Stage.players, kept up to date by kill_player.
+    census = engine.Census()
     player_count = 0
     agent_number = 0
     # player_log = "Output text goes here"
@@ -78,38 +80,11 @@ class Stage(Screen):
 
     @staticmethod
     def create_players(player_count, agent_number):
-        players = []
-
-        for number in range(player_count):
-            name = 'player {}'.format(number)
-            icon = "data/icons/easter_egg.png" if random.random() < 0.01 else "data/icons/player_alive.png"
-            agent = False
-
-            players.append(Player(
-                name=name,
-                number=number,
-                alive=True,
-                mafia=False,
-                agent=agent,
-                icon=icon,
-                strategic_value=0
-            ))
-
-        if 0 <= agent_number < player_count:
-            new_agent = players[agent_number]
-            Logger.debug("Player: Agent assuming the role of {}.".format(new_agent.name))
-            # All values that need to be set for
-            # the agent should be set here.
-
-            new_agent.name = "agent"
-            new_agent.icon = './data/icons/agent_alive.png'
-            new_agent.agent = True
-
-        number_of_mafia = math.floor(math.sqrt(player_count))
-        mafia_members = random.sample(players, number_of_mafia)
-
-        for player in mafia_members:
-            player.mafia = True
+        players = [Player(**dict(state)) for state in engine.create_players(player_count, agent_number)]
+
+        for player in players:
+            if player.agent:
+                Logger.debug("Player: Agent assuming the role of {}.".format(player.name))
 
         return players
 
@@ -131,31 +106,29 @@ class Stage(Screen):
 
     @staticmethod
     def check_for_winner(players):
+        return engine.check_for_winner(players)
 
-        winner = "Nobody"
-        mafia_count = 0
-        towny_count = 0
-
-        for player in players:
-            if player.alive:
-                if player.mafia:
-                    mafia_count += 1
-                else:
-                    towny_count += 1
-
-        if mafia_count == 0:
-            winner = "Town"
+    @staticmethod
+    def kill_player(player):
+        """
+        Kill one of Stage.players and update the census to match.
+        """
+        if player.alive:
+            Stage.census.kill(player)
 
-        if towny_count == 0:
-            winner = "Mafia"
+        player.alive = False
+        player.icon = "data/icons/player_dead.png"
 
-        return winner
+    @staticmethod
+    def new_game():
+        Stage.initialize_settings()
+        Stage.players = Stage.create_players(Stage.player_count, Stage.agent_number)
+        Stage.census = engine.Census(Stage.players)
 
 
 class MainMenu(Stage):
     def ready_game(self):
-        self.initialize_settings()
-        Stage.players = self.create_players(Stage.player_count, Stage.agent_number)
+        self.new_game()
 
 
 class Tutorial(Stage):
@@ -184,6 +157,7 @@ class Discussion(Stage):
         else:
             Logger.info("Discussion: Most accused player: {}".format(most_accused.name))
             Stage.players[most_accused.number].is_on_trial = True
+            Stage.census.defendant = most_accused.number
             self.manager.current = "loadingDT"
 
     def get_player_class(self, player):
@@ -229,30 +203,23 @@ class Discussion(Stage):
 
         :return: A reference to the player to be put on trial, or None
         """
-        accusations = [0] * len(players)
-        suspicions = [0] * len(players)
-
-        for player in players:
-            if player.actions['accuse']['player'] is not None:
-                accusations[player.actions['accuse']['player'].number] += 1
-            if player.actions['suspect']['player'] is not None:
-                suspicions[player.actions['suspect']['player'].number] += 1
-
-        most_accused, accusation_amount = max(enumerate(accusations), key=lambda p: p[1])
+        accusations = engine.tally(
+            (Discussion.target_number(player, 'accuse') for player in players), len(players)
+        )
+        most_accused = engine.most_accused(accusations)
 
-        if dict(Counter(accusations))[accusation_amount] > 1:
-            Logger.debug("Discussion: Accusation Counts: {}".format(dict(Counter(accusations))))
+        if most_accused is None:
+            Logger.debug("Discussion: Accusation Counts: {}".format(accusations))
             Logger.info("Discussion: There was a tie amongst the accused.")
-            # most_accused = max(suspicions, key=suspicions.get)
-            # accusation_amount = max(suspicions.values())
             return None
 
-            # if dict(Counter(suspicions.values()))[accusation_amount] > 1:
-            #     Logger.info("Tie amongst the players, no one goes on trial.")
-            #     return None
-
         return players[most_accused]
 
+    @staticmethod
+    def target_number(player, action):
+        target = player.actions[action]['player']
+        return None if target is None else target.number
+
 
 class Trial(Stage):
     player_on_trial = ObjectProperty()
@@ -276,8 +243,7 @@ class Trial(Stage):
 
         if verdict == "guilty":
             Logger.info("{} is guilty!".format(self.player_on_trial.name))
-            self.player_on_trial.icon = "data/icons/player_dead.png"
-            self.player_on_trial.alive = False
+            Stage.kill_player(self.player_on_trial)
         elif verdict == "innocent":
             Logger.info("{} is innocent!".format(self.player_on_trial.name))
             self.player_on_trial.icon = "data/icons/player_alive.png"
@@ -286,7 +252,8 @@ class Trial(Stage):
             # This could be changed so that the result is decided by a coin toss or something similar.
             self.player_on_trial.icon = "data/icons/player_alive.png"
 
-        winner = Stage.check_for_winner(Stage.players)
+        Stage.census.defendant = None
+        winner = Stage.census.winner
         if winner == "Nobody":
             self.manager.current = "loadingTN"
         else:
@@ -297,17 +264,11 @@ class Trial(Stage):
     def on_enter(self, *args):
         super().on_enter(*args)
 
-        if not any(player.is_on_trial for player in Stage.players):
-            Logger.error("Trial: No player has the is_on_trial variable set to true in the trial stage!")
-
-        for player in Stage.players:
-            if player.is_on_trial:
-                self.player_on_trial = player
-                break
-
-        if self.player_on_trial is None:
+        if Stage.census.defendant is None:
             Logger.error("Trial: No player was put on trial despite having entered the trial stage!")
 
+        self.player_on_trial = Stage.players[Stage.census.defendant]
+
         self.player_on_trial.icon = "data/icons/player_on_trial.png"
         self.add_players(Stage.players)
 
@@ -321,27 +282,25 @@ class Trial(Stage):
         Step through the players, count their votes, and decide on a verdict.
         :return: A string with the value of guilty, innocent, or tie.
         """
-        vote = {'guilty': 0, 'innocent': 0}
+        decisions = []
 
         for player in players:
             decision = player.actions['vote']['decision']
 
             if decision is None:
                 Logger.warning("{} had None in their vote:decision field!".format(player.name))
-                continue
-
-            if decision == "abstain":
+            elif decision == "abstain":
                 Logger.info("{} decided to abstain.".format(player.name))
-                continue
+            else:
+                Logger.info("{} voted {}".format(player.name, decision))
+
+            decisions.append(decision)
 
-            Logger.info("{} voted {}".format(player.name, decision))
-            vote[decision] += 1
+        verdict = engine.decide_verdict(decisions)
 
-        if vote['guilty'] == vote['innocent']:
-            verdict = "tie"
+        if verdict == "tie":
             Logger.info("The vote was a tie.")
         else:
-            verdict = max(vote, key=vote.get)
             Logger.info("The verdict was {}.".format(verdict))
 
         return verdict
@@ -364,7 +323,7 @@ class Night(Stage):
         if self.selected_player:
             Stage.players[self.selected_player.number].die()
 
-        winner = Stage.check_for_winner(Stage.players)
+        winner = Stage.census.winner
         if winner == "Nobody":
             self.manager.current = "loadingND"
         else:
@@ -400,8 +359,7 @@ class Night(Stage):
 
 class GameOverMenu(Stage):
     def ready_game(self):
-        self.initialize_settings()
-        Stage.players = self.create_players(Stage.player_count, Stage.agent_number)
+        self.new_game()
 
 
 class LoadingScreen(Stage):
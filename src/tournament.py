@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Play seeded headless games between reasoners across a process pool.
+
+A reasoner decides for every player on one side of the table. Each
+pairing of a town reasoner with a mafia reasoner plays the same set of
+seeds, so differences in win rate come from the reasoners alone.
+"""
+from collections import Counter
+from itertools import product
+import multiprocessing
+import os
+
+import click
+
+try:
+    import engine
+except ModuleNotFoundError:
+    from . import engine
+
+
+class Reasoner:
+    """
+    Base class for pluggable reasoners. The default does nothing, which
+    leaves every player abstaining and the mafia asleep.
+
+    Subclasses must be picklable, as they are sent to the worker processes.
+    """
+    name = "passive"
+
+    def discuss(self, game, player) -> None:
+        """Record the accusations and suspicions of player."""
+        pass
+
+    def vote(self, game, player) -> None:
+        """Record the vote of player on the current defendant."""
+        pass
+
+    def choose_victim(self, game, mafia):
+        """
+        :param mafia: The living mafia members.
+        :return: The number of the player to kill, or None.
+        """
+        return None
+
+
+class RandomReasoner(Reasoner):
+    """
+    Behaves like the agent in :meth:`stages.LoadingScreen.call_reasoner`.
+    """
+    name = "random"
+
+    def discuss(self, game, player) -> None:
+        choices = [other.number for other in game.alive_players() if other is not player]
+        if choices:
+            player.act_on('accuse', game.rng.choice(choices))
+
+    def vote(self, game, player) -> None:
+        player.vote = engine.GUILTY if game.rng.random() > 0.5 else engine.INNOCENT
+
+    def choose_victim(self, game, mafia):
+        choices = [other.number for other in game.alive_players() if not other.mafia]
+        return game.rng.choice(choices) if choices else None
+
+
+class LoyalReasoner(RandomReasoner):
+    """
+    A random reasoner that never turns on its own side when playing mafia.
+    """
+    name = "loyal"
+
+    def discuss(self, game, player) -> None:
+        if not player.mafia:
+            return super().discuss(game, player)
+
+        choices = [other.number for other in game.alive_players() if not other.mafia]
+        if choices:
+            player.act_on('accuse', game.rng.choice(choices))
+
+    def vote(self, game, player) -> None:
+        if player.mafia and game.players[game.defendant].mafia:
+            player.vote = engine.INNOCENT
+        elif player.mafia:
+            player.vote = engine.GUILTY
+        else:
+            super().vote(game, player)
+
+
+REASONERS = {reasoner.name: reasoner for reasoner in (Reasoner, RandomReasoner, LoyalReasoner)}
+
+
+def play(game, town, mafia, max_rounds=None) -> str:
+    """
+    Play a game to the end with town and mafia reasoners.
+
+    :param max_rounds: Give up after this many rounds, defaults to the
+        number of players.
+    :return: The winner, "Nobody" if the game was given up.
+    """
+    if max_rounds is None:
+        max_rounds = len(game)
+
+    while game.phase != engine.GAME_OVER and game.round < max_rounds:
+        if game.phase == engine.DISCUSSION:
+            for player in game.alive_players():
+                (mafia if player.mafia else town).discuss(game, player)
+            game.discussion()
+        elif game.phase == engine.TRIAL:
+            for player in game.alive_players():
+                if not player.is_on_trial:
+                    (mafia if player.mafia else town).vote(game, player)
+            game.trial()
+        else:
+            members = [player for player in game.alive_players() if player.mafia]
+            game.night(mafia.choose_victim(game, members))
+
+    return game.winner
+
+
+def play_seed(match) -> tuple:
+    """
+    Worker entry point.
+
+    :param match: A tuple of (town reasoner, mafia reasoner, player count, seed).
+    :return: A tuple of (town name, mafia name, winner).
+    """
+    town, mafia, player_count, seed = match
+    game = engine.Game(player_count, seed=seed)
+    return town.name, mafia.name, play(game, town, mafia)
+
+
+def run_tournament(reasoners, games, player_count, processes=None, seed=0) -> dict:
+    """
+    Play every pairing of reasoners as town and mafia for a number of games.
+
+    :param reasoners: Reasoner instances, keyed by their ``name``.
+    :param processes: Number of worker processes, defaults to one per core.
+    :return: A dict mapping (town name, mafia name) to the fraction of
+        games won by each side.
+    """
+    matches = [
+        (town, mafia, player_count, seed + game)
+        for town, mafia in product(reasoners, repeat=2)
+        for game in range(games)
+    ]
+    processes = processes or os.cpu_count()
+    chunksize = max(1, len(matches) // (processes * 4))
+
+    results = {}
+    with multiprocessing.Pool(processes) as pool:
+        for town, mafia, winner in pool.imap_unordered(play_seed, matches, chunksize):
+            results.setdefault((town, mafia), Counter())[winner] += 1
+
+    return {
+        pairing: {side: wins[side] / games for side in (engine.TOWN, engine.MAFIA, engine.NOBODY)}
+        for pairing, wins in results.items()
+    }
+
+
+@click.command()
+@click.option('-g', '--games', help='Games per pairing', default=1000)
+@click.option('-p', '--players', help='Players per game', default=10)
+@click.option('-j', '--processes', help='Worker processes, one per core by default', default=0)
+@click.option('-s', '--seed', help='Seed of the first game', default=0)
+@click.argument('names', nargs=-1, type=click.Choice(sorted(REASONERS)))
+def main(games, players, processes, seed, names):
+    """Play every pairing of the named reasoners and print win rates.
+    """
+    reasoners = [REASONERS[name]() for name in names or sorted(REASONERS)]
+    results = run_tournament(reasoners, games, players, processes or None, seed)
+
+    for (town, mafia), rates in sorted(results.items()):
+        click.echo("{:>10} vs {:<10} town {:6.1%}  mafia {:6.1%}  undecided {:6.1%}".format(
+            town, mafia, rates[engine.TOWN], rates[engine.MAFIA], rates[engine.NOBODY]
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src import batch
+
+
+class TestBatch(TestCase):
+    def test_create_mafia(self):
+        mafia = batch.create_mafia(np.random.default_rng(0), 50, 10)
+        self.assertTrue((mafia.sum(axis=1) == 3).all())
+
+    def test_count_accusations(self):
+        accusing = np.array([[1, 2, 1, -1], [1, 2, -1, -1], [-1, -1, -1, -1]])
+        self.assertEqual(batch.count_accusations(accusing).tolist(), [1, -1, -1])
+
+    def test_decide_verdict(self):
+        votes = np.array([[1, 1, -1], [1, -1, 0], [-1, 0, 0]], dtype=np.int8)
+        self.assertEqual(batch.decide_verdict(votes).tolist(), [batch.GUILTY, batch.TIE, batch.INNOCENT])
+
+    def test_check_for_winner(self):
+        mafia = np.array([[True, False], [True, False], [True, False]])
+        alive = np.array([[True, True], [False, True], [True, False]])
+        self.assertEqual(batch.check_for_winner(alive, mafia).tolist(), [batch.NOBODY, batch.TOWN, batch.MAFIA])
+
+    def test_play_random(self):
+        game = batch.BatchGame(200, 10, seed=3)
+        winners = game.play_random()
+        self.assertFalse((winners == batch.NOBODY).any())
+        self.assertAlmostEqual(sum(batch.win_rates(winners).values()), 1.)
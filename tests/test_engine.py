@@ -0,0 +1,65 @@
+from unittest import TestCase
+from src import engine
+
+
+class TestEngine(TestCase):
+    def test_create_players(self):
+        players = engine.create_players(10, 2, engine.random.Random(4))
+        self.assertEqual([player.number for player in players], list(range(10)))
+        self.assertEqual(sum(player.mafia for player in players), 3)
+        self.assertTrue(players[2].agent)
+        self.assertEqual(players[2].name, "agent")
+
+    def test_most_accused(self):
+        self.assertEqual(engine.most_accused(engine.tally([1, 1, None, 2], 4)), 1)
+        self.assertIsNone(engine.most_accused(engine.tally([1, 2, None, None], 4)))
+        self.assertIsNone(engine.most_accused([0, 0, 0]))
+
+    def test_decide_verdict(self):
+        self.assertEqual(engine.decide_verdict(["guilty", "guilty", "innocent"]), "guilty")
+        self.assertEqual(engine.decide_verdict(["innocent", "abstain", None]), "innocent")
+        self.assertEqual(engine.decide_verdict(["guilty", "innocent", "abstain"]), "tie")
+
+    def test_check_for_winner(self):
+        players = [engine.PlayerState(number=n, mafia=n == 0) for n in range(3)]
+        self.assertEqual(engine.check_for_winner(players), "Nobody")
+        players[0].die()
+        self.assertEqual(engine.check_for_winner(players), "Town")
+
+    def test_act_on(self):
+        player = engine.PlayerState(number=0)
+        self.assertFalse(player.act_on('accuse', 0))
+        self.assertTrue(player.act_on('accuse', 1))
+        self.assertFalse(player.act_on('suspect', 1))
+        self.assertEqual(dict(player)['actions']['accuse']['player'], 1)
+
+    def test_phases(self):
+        game = engine.Game(5, seed=1)
+        for player in game.players:
+            player.act_on('accuse', 3)
+            player.vote = "guilty"
+
+        self.assertEqual(game.discussion(), 3)
+        self.assertEqual(game.phase, engine.TRIAL)
+        self.assertEqual(game.trial(), "guilty")
+        self.assertFalse(game.players[3].alive)
+
+        if game.phase == engine.NIGHT:
+            game.night()
+            self.assertEqual(game.phase, engine.DISCUSSION)
+            self.assertIsNone(game.players[0].accusing)
+
+        with self.assertRaises(ValueError):
+            game.trial()
+
+    def test_census(self):
+        players = [engine.PlayerState(number=n, mafia=n < 2) for n in range(5)]
+        players[4].is_on_trial = True
+        census = engine.Census(players)
+        self.assertEqual((census.alive_mafia, census.alive_town, census.defendant), (2, 3, 4))
+
+        census.kill(players[4])
+        self.assertIsNone(census.defendant)
+        census.kill(players[0])
+        census.kill(players[1])
+        self.assertEqual(census.winner, engine.TOWN)
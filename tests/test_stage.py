@@ -16,3 +16,15 @@ class TestStage(TestCase):
 
     def test_on_pre_leave(self):
         self.fail()
+
+    def test_kill_player(self):
+        from src import stages
+        stages.Stage.players = stages.Stage.create_players(5, 0)
+        stages.Stage.census = stages.engine.Census(stages.Stage.players)
+        towny = next(player for player in stages.Stage.players if not player.mafia)
+
+        stages.Stage.kill_player(towny)
+        stages.Stage.kill_player(towny)
+        self.assertFalse(towny.alive)
+        self.assertEqual(stages.Stage.census.alive_town, 2)
+        self.assertEqual(stages.Stage.census.winner, stages.Stage.check_for_winner(stages.Stage.players))
@@ -0,0 +1,23 @@
+from unittest import TestCase
+from src import engine, tournament
+
+
+class TestTournament(TestCase):
+    def test_play(self):
+        reasoner = tournament.RandomReasoner()
+        winners = {tournament.play(engine.Game(8, seed=seed), reasoner, reasoner) for seed in range(20)}
+        self.assertTrue(winners <= {engine.TOWN, engine.MAFIA})
+
+    def test_play_is_seeded(self):
+        town, mafia = tournament.RandomReasoner(), tournament.LoyalReasoner()
+        first = [tournament.play_seed((town, mafia, 8, seed)) for seed in range(10)]
+        second = [tournament.play_seed((town, mafia, 8, seed)) for seed in range(10)]
+        self.assertEqual(first, second)
+
+    def test_run_tournament(self):
+        reasoners = [tournament.Reasoner(), tournament.RandomReasoner()]
+        results = tournament.run_tournament(reasoners, 10, 6, processes=2)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[("passive", "passive")][engine.NOBODY], 1.)
+        for rates in results.values():
+            self.assertAlmostEqual(sum(rates.values()), 1.)